@@ -1,12 +1,22 @@
 import asyncio
+import contextvars
+import orjson
+import queue
 import sys
 import os
+import threading
+import time
+import httpx
 from crewai import LLM, Agent, Task, Crew
+from crewai.agents.agent_builder.utilities.base_token_process import TokenProcess
+from crewai.utilities.events import crewai_event_bus, LLMStreamChunkEvent
+from fastapi.concurrency import run_in_threadpool
 
-from crewai_tools import MCPServerAdapter
-from configuration.mcp_config import MCPConfig
+from lazy_toolset import LazyToolset
+from mcp_pool import mcp_pool
 from utils.log_helper import LogHelper
 from utils.config_helper import ConfigHelper
+from utils.http_helper import HttpHelper
 
 # Fix for Windows MCP subprocess issue
 if sys.platform == "win32":
@@ -14,60 +24,202 @@ if sys.platform == "win32":
 
 model_name = ConfigHelper.get_ollama_model()
 
-llm = LLM(
+# On every call, crewai swaps the token counting callback of the calling agent into
+# the process-global litellm callbacks. Two concurrent swaps can remove the same
+# callback twice and fail the query, so they are serialized
+_callbacks_lock = threading.Lock()
+
+class _LLM(LLM):
+    def set_callbacks(self, callbacks):
+        with _callbacks_lock:
+            super().set_callbacks(callbacks)
+
+# Concurrent queries call Ollama directly, it serves up to OLLAMA_NUM_PARALLEL requests at once
+llm = _LLM(
+    model=f"ollama/{model_name}",
+    base_url=ConfigHelper.get_ollama_base_url(),
+    # Pooled keep-alive connections to Ollama, shared by all LLM calls
+    client=HttpHelper.get_ollama_handler()
+)
+
+# Same LLM with token streaming, only used by the queries streamed to the client
+streaming_llm = _LLM(
     model=f"ollama/{model_name}",
     base_url=ConfigHelper.get_ollama_base_url(),
-    streaming=True
+    stream=True,
+    client=HttpHelper.get_ollama_handler()
 )
 
 print(f"Using LLM model: {model_name}")
 
-# Load server parameters from the appropriate config file
-server_params = MCPConfig(ConfigHelper.get_config_path()).get_all_server_params()
+# Load the model in Ollama with a 1-token generation, so the first query doesn't pay for it
+def warm_up_llm() -> float:
+    warmup_llm = _LLM(
+        model=f"ollama/{model_name}",
+        base_url=ConfigHelper.get_ollama_base_url(),
+        max_tokens=1,
+        client=HttpHelper.get_ollama_handler()
+    )
+    start = time.perf_counter()
+    warmup_llm.call("warmup")
+    latency_ms = round((time.perf_counter() - start) * 1000, 1)
+    print(f"LLM model {model_name} warmed up in {latency_ms} ms")
+    return latency_ms
 
-# Create and run Crew
-def run_query(query: str):
+# Check Ollama connectivity and ping the pooled MCP servers
+def get_health() -> dict:
+    start = time.perf_counter()
+    try:
+        HttpHelper.get_ollama_client().get("/api/version", timeout=5).raise_for_status()
+        ollama = {"ok": True, "latency_ms": round((time.perf_counter() - start) * 1000, 1)}
+    except httpx.HTTPError as e:
+        ollama = {"ok": False, "error": str(e) or type(e).__name__}
+
+    return {
+        "ollama": ollama,
+        "mcp_servers": mcp_pool.status(),
+        "tools_count": mcp_pool.tools_count
+    }
+
+# Per-query sink for streamed chunks, set only while a query is being streamed
+_stream_sink = contextvars.ContextVar("stream_sink", default=None)
+
+def _emit(event_type: str, content):
+    sink = _stream_sink.get()
+    if sink is not None:
+        sink({"type": event_type, "content": content})
+
+@crewai_event_bus.on(LLMStreamChunkEvent)
+def _on_llm_chunk(source, event):
+    _emit("token", event.chunk)
+
+# Chunks only go to the sink of their query: drop the CrewAI console handler, which
+# prints every token to stdout and keeps all of them in a buffer that is never cleared
+crewai_event_bus._handlers[LLMStreamChunkEvent] = [_on_llm_chunk]
+
+def _on_step(output):
+    LogHelper.log_step_callback(output)
+    _emit("step", getattr(output, "text", None) or str(output))
+
+# Create the Crew, the query is passed later through the kickoff inputs
+def _build_crew(tools) -> Crew:
+
+    # Only one-line tool descriptions go in the prompt, full schemas are fetched on demand
+    if ConfigHelper.use_lazy_tool_schemas():
+        tools = LazyToolset(tools).tools
 
-    with MCPServerAdapter(server_params) as tools:
+    worker_agent = Agent(
+        role="Website Fetcher Agent",
+        goal="Fetch data from websites or APIs.",
+        backstory="A specialized AI agent that leverages available MCP tools for fetching data from any website or API.",
+        tools=tools,
+        reasoning=False, # Optional
+        verbose=False, # Optional
+        step_callback=_on_step, # Optional
+        # The crew is reused across queries, don't serve tool results fetched for an earlier one
+        cache=False,
+        llm=llm
+    )
     
-        print(f"Available tools from MCP servers: {[tool.name for tool in tools]}")
-
-        worker_agent = Agent(
-            role="Website Fetcher Agent",
-            goal="Fetch data from websites or APIs.",
-            backstory="A specialized AI agent that leverages available MCP tools for fetching data from any website or API.",
-            tools=tools,
-            reasoning=False, # Optional
-            verbose=False, # Optional
-            step_callback=LogHelper.log_step_callback, # Optional
-            llm=llm
-        )
-        
-        # Passing query directly into task
-        processing_task = Task(
-            description="""Process the following query and choose which tool should be called: {query}
-
-            Call the most appropriate tool and provide a detailed and comprehensive answer that resulted 
-            from the analysis of fetched data from a website or API. 
-            If the answer is not a result from the analysis of fetched data from a website or API, return to the query caller claiming that you do not know the answer. 
-            """,
-            expected_output="A comprehensive answer to the query and any relevant output related with the response from the tool that was called.",
-            #expected_output="Only the output from the MCP tools",
-            agent=worker_agent,
-            callback=LogHelper.log_task_callback, # Optional
-        )
-        
-        data_crew = Crew(
-            agents=[worker_agent],
-            tasks=[processing_task],
-            verbose=False
-        )
+    # Passing query directly into task
+    processing_task = Task(
+        description="""Process the following query and choose which tool should be called: {query}
+
+        Call the most appropriate tool and provide a detailed and comprehensive answer that resulted 
+        from the analysis of fetched data from a website or API. 
+        If the answer is not a result from the analysis of fetched data from a website or API, return to the query caller claiming that you do not know the answer. 
+        """,
+        expected_output="A comprehensive answer to the query and any relevant output related with the response from the tool that was called.",
+        #expected_output="Only the output from the MCP tools",
+        agent=worker_agent,
+        callback=LogHelper.log_task_callback, # Optional
+    )
     
-        result = data_crew.kickoff(inputs={"query": query})
-        return {"result": result}
+    return Crew(
+        agents=[worker_agent],
+        tasks=[processing_task],
+        cache=False,
+        verbose=False
+    )
+
+# Pool of pre-built crews with the tools they were built with. A Crew can't run
+# concurrent kickoffs, so each query checks one out and the pool grows up to the
+# number of concurrent queries
+_crews = queue.SimpleQueue()
+
+def prebuild_crews(count: int = 1):
+    tools = mcp_pool.get_tools()
+    for _ in range(count):
+        _crews.put((tools, _build_crew(tools)))
+
+# Run a query on a pooled Crew
+# Called concurrently from the API thread pool: a Crew is used by one query at a time
+# and the pooled MCP tools are safe to share. CrewAI itself is not safe for concurrent
+# kickoffs, as the token counting callbacks are global (see _LLM): with concurrent
+# queries, the token_usage of a result may include tokens of other queries
+def run_query(query: str):
+
+    # Tools come from the shared MCP pool, so MCP servers are not respawned per query
+    tools = mcp_pool.get_tools()
+
+    try:
+        crew_tools, data_crew = _crews.get_nowait()
+        if crew_tools is not tools:
+            # The MCP pool reconnected since this crew was built
+            data_crew = _build_crew(tools)
+    except queue.Empty:
+        data_crew = _build_crew(tools)
+
+    # Clear the state left by the previous query run on this crew: tool results, token
+    # usage (reported in the result, only exact when queries run one at a time) and the
+    # error count used for retries
+    for agent in data_crew.agents:
+        agent.tools_results = []
+        agent._token_process = TokenProcess()
+        agent._times_executed = 0
+        # Only stream the LLM tokens when the query is streamed (see run_query_stream)
+        agent.llm = streaming_llm if _stream_sink.get() is not None else llm
+
+    try:
+        return {"result": data_crew.kickoff(inputs={"query": query})}
+    finally:
+        _crews.put((tools, data_crew))
+
+# Stream a query as Server-Sent Events: LLM tokens and agent steps are yielded
+# as they are produced, followed by the final result
+async def run_query_stream(query: str):
+
+    loop = asyncio.get_running_loop()
+    chunks = asyncio.Queue()
+
+    def push(chunk):
+        loop.call_soon_threadsafe(chunks.put_nowait, chunk)
+
+    def worker():
+        # Runs in a copy of the caller context, so the sink is only seen by this query
+        _stream_sink.set(push)
+        try:
+            result = run_query(query)["result"]
+            push({"type": "result", "content": result.raw})
+        except Exception as e:
+            push({"type": "error", "content": str(e)})
+        finally:
+            push(None)
+
+    task = asyncio.ensure_future(run_in_threadpool(worker))
+    try:
+        while (chunk := await chunks.get()) is not None:
+            yield b"data: " + orjson.dumps(chunk) + b"\n\n"
+    finally:
+        await task
 
 if __name__ == "__main__":
-    result = run_query("Show me the list of all tools available.")
+    LogHelper.configure_logging()
+    try:
+        result = run_query("Show me the list of all tools available.")
+    finally:
+        mcp_pool.shutdown()
+        LogHelper.stop_logging()
     print(f"""
         Query completed!
         result: {result}
@@ -1,62 +1,116 @@
 import os
-import json
+import orjson
+import pathlib
+import functools
 
+import httpx
 from mcp import StdioServerParameters
 
+def _parse_config(config_file: str) -> dict:
+    # orjson parses several times faster than the stdlib json module
+    return orjson.loads(pathlib.Path(config_file).read_bytes())
+
+def _create_http_client(headers=None, timeout=None, auth=None) -> httpx.AsyncClient:
+    """httpx client factory for streamable-http MCP servers: same defaults as
+    the MCP SDK factory, which already pools connections per session, with larger
+    pool limits and a longer keep-alive expiry.
+    """
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=timeout or httpx.Timeout(30.0),
+        auth=auth,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60),
+        follow_redirects=True
+    )
+
+def _build_server_params(server_config: dict):
+    if server_config.get("type") == "StdIO":
+        return StdioServerParameters(
+            command=server_config.get("command"),
+            args=server_config.get("args", []),
+            env=os.environ
+        )
+    elif server_config.get("type") == "streamable-http":
+        return {
+            "url": server_config.get("url"),
+            "headers": server_config.get("headers", {}),
+            # Without an explicit transport, the MCP adapter opens these servers over SSE
+            "transport": "streamable-http",
+            # Larger connection pool limits for the requests of this MCP session
+            "httpx_client_factory": _create_http_client
+        }
+    elif server_config.get("type") == "sse":
+        return {
+            "url": server_config.get("url"),
+            "headers": server_config.get("headers", {}),
+            "transport": "sse"
+        }
+    else:
+        raise ValueError(f"Unsupported MCP server type: {server_config.get('type')}")
+
+@functools.lru_cache(maxsize=8)
+def _load(config_file: str, mtime: float) -> tuple:
+    """Parse a config file and build all its server parameters once per (file, mtime).
+    Returns a (mcp_servers, server_params) tuple, server_params only holds the
+    (server_id, params) pairs of the servers whose parameters could be created.
+    """
+    mcp_servers = _parse_config(config_file).get("mcpServers", {})
+
+    server_params = []
+    for server_id, server_config in mcp_servers.items():
+        try:
+            server_params.append((server_id, _build_server_params(server_config)))
+        except ValueError as e:
+            # Skip problematic server configurations
+            print(f"Warning: Skipping server '{server_id}': {str(e)}")
+    return mcp_servers, tuple(server_params)
+
 class MCPConfig:
     def __init__(self, config_file: str):
         self.config_file = config_file
-        self.mcp_servers = self._load_mcp_servers()
+        self.mcp_servers = self._load_mcp_servers()[0]
 
-    def _load_mcp_servers(self):
+    def _load(self) -> tuple:
+        # Keyed on the modification time, so an edited file is parsed again
+        return _load(self.config_file, os.path.getmtime(self.config_file))
+
+    def _load_mcp_servers(self) -> tuple:
         try:
-            with open(self.config_file, 'r') as f:
-                config = json.load(f)
-            return config.get("mcpServers", {})
+            return self._load()
         except FileNotFoundError:
             print(f"ERROR: MCP config file not found: {self.config_file}")
             print(f"Current working directory: {os.getcwd()}")
             raise
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             print(f"ERROR: Invalid JSON in MCP config file: {self.config_file}")
             raise
-    
+
     def get_server_params(self, server_id: str):
         server_config = self.mcp_servers.get(server_id)
         if not server_config:
             raise ValueError(f"Server ID '{server_id}' not found in MCP configuration.")
-        
-        if server_config.get("type") == "StdIO":
-            return StdioServerParameters(
-                command=server_config.get("command"),
-                args=server_config.get("args", []),
-                env=os.environ
-            )
-        elif server_config.get("type") == "streamable-http" or server_config.get("type") == "sse":
-            return {
-                "url": server_config.get("url"),
-                "headers": server_config.get("headers", {})
-            }
-        else:
-            raise ValueError(f"Unsupported MCP server type: {server_config.get('type')}")
+
+        return _build_server_params(server_config)
 
     def get_all_server_params(self):
         """Return a list of all server parameters from the configuration file.
         Only returns server parameters that are successfully created (ignores errors).
         """
-        server_params = []
-        for server_id in self.mcp_servers.keys():
-            try:
-                param = self.get_server_params(server_id)
-                server_params.append(param)
-            except ValueError as e:
-                # Skip problematic server configurations
-                print(f"Warning: Skipping server '{server_id}': {str(e)}")
-        return server_params
+        return list(self.get_all_server_params_by_id().values())
+
+    def get_all_server_params_by_id(self) -> dict:
+        """Same as get_all_server_params, keyed by the server IDs of the configuration file."""
+        # The servers and their parameters come from the same cached parse of the file
+        self.mcp_servers, server_params = self._load_mcp_servers()
+        # Copy the dict entries, the cached ones are shared by every caller
+        return {
+            server_id: dict(param) if isinstance(param, dict) else param
+            for server_id, param in server_params
+        }
     
 # For running as a script
 # ie poetry run python mcp_config.py
 if __name__ == "__main__":
     config = MCPConfig("..\\mcp-config.json")
     all_server_params = config.get_all_server_params()
-    print(all_server_params)
\ No newline at end of file
+    print(all_server_params)
@@ -0,0 +1,84 @@
+import orjson
+from typing import Type
+
+from crewai.tools import BaseTool
+from pydantic import BaseModel, Field, PrivateAttr
+
+
+class _ToolSchemaArgs(BaseModel):
+    tool_name: str = Field(..., description="Name of the tool to get the full description and arguments of")
+
+
+def _original_description(tool: BaseTool) -> str:
+    # BaseTool prefixes the description with the tool name and arguments, keep the original text
+    return tool.description.partition("Tool Description:")[2].strip() or tool.description.strip()
+
+
+def _summary(tool: BaseTool) -> str:
+    lines = [line.strip() for line in _original_description(tool).splitlines() if line.strip()]
+    return lines[0] if lines else tool.name
+
+
+class _LazyTool(BaseTool):
+    """Proxy that exposes a tool with a one-line description and forwards calls to it."""
+
+    _target: BaseTool = PrivateAttr()
+
+    def __init__(self, target: BaseTool):
+        # Same arguments schema as the real tool, CrewAI only passes the arguments it lists
+        super().__init__(
+            name=target.name,
+            description=f"{_summary(target)} (call get_tool_schema to get its arguments)",
+            args_schema=target.args_schema
+        )
+        self._target = target
+
+    def _generate_description(self):
+        # Unlike BaseTool, leave the arguments out of the description shown in the prompt
+        self.description = f"Tool Name: {self.name}\nTool Description: {self.description}"
+
+    def _run(self, **kwargs):
+        return self._target.run(**kwargs)
+
+
+class _ToolSchemaTool(BaseTool):
+    """Meta-tool returning the full description and arguments schema of a tool."""
+
+    name: str = "get_tool_schema"
+    description: str = (
+        "Get the full description and JSON schema of the arguments of a tool. "
+        "Call it before using a tool for the first time."
+    )
+    args_schema: Type[BaseModel] = _ToolSchemaArgs
+    _schemas: dict = PrivateAttr()
+
+    def __init__(self, schemas: dict):
+        super().__init__()
+        self._schemas = schemas
+
+    def _run(self, tool_name: str) -> str:
+        schema = self._schemas.get(tool_name)
+        if schema is None:
+            return f"Unknown tool '{tool_name}'. Available tools: {', '.join(self._schemas)}"
+        return schema
+
+
+class LazyToolset:
+    """
+    Two-tier view over a list of tools to keep the agent prompt small.
+
+    Tier 1: every tool is presented with a one-line description and no argument schema.
+    Tier 2: the full description and JSON schema of a tool are returned on demand by
+    the extra `get_tool_schema` tool. Calls to the other tools are proxied to the real ones.
+    """
+
+    def __init__(self, tools):
+        self.schemas = {
+            tool.name: orjson.dumps({
+                "name": tool.name,
+                "description": _original_description(tool),
+                "parameters": tool.args_schema.model_json_schema()
+            }).decode()
+            for tool in tools
+        }
+        self.tools = [_ToolSchemaTool(self.schemas)] + [_LazyTool(tool) for tool in tools]
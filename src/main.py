@@ -1,46 +1,103 @@
-import uvicorn
+import asyncio
 import os
-import signal
 import sys
 
 # Add the current directory to Python path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+import anyio
+import anyio.to_thread
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from contextlib import asynccontextmanager
-from pydantic import BaseModel
-from assistant_orchestrator import run_query
+from pydantic import BaseModel, Field
+from assistant_orchestrator import get_health, prebuild_crews, run_query, run_query_stream, warm_up_llm
+from mcp_pool import mcp_pool
+from utils.config_helper import ConfigHelper
+from utils.http_helper import HttpHelper
+from utils.log_helper import LogHelper
 
 class QueryRequest(BaseModel):
     query: str
+    stream: bool = False
+
+class QueryBatchRequest(BaseModel):
+    queries: list[str] = Field(min_length=1, max_length=ConfigHelper.get_max_batch_queries())
+
+# Health checks get their own threads: the default thread pool can be fully taken by
+# long-running queries, and the health check must still answer under load
+health_limiter = anyio.CapacityLimiter(2)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup: Register SIGTERM handler
-    signal.signal(signal.SIGTERM, sigterm_handler)
+    # Startup: Write logs from a dedicated thread
+    LogHelper.configure_logging()
+    # Startup: Size the thread pool that runs the blocking CrewAI queries
+    anyio.to_thread.current_default_thread_limiter().total_tokens = ConfigHelper.get_thread_pool_size()
+    # Startup: Connect to MCP servers once and share them across requests
+    await run_in_threadpool(mcp_pool.startup)
+    # Startup: Build the Agent/Task/Crew once instead of on every request. Without
+    # MCP servers, the first request connects to them and builds its crew
+    if mcp_pool.connected:
+        await run_in_threadpool(prebuild_crews)
+    # Startup: Load the model in Ollama now instead of on the first request
+    try:
+        await run_in_threadpool(warm_up_llm)
+    except Exception as e:
+        print(f"Warning: LLM warm-up failed: {e}")
     yield
-    # Shutdown: Add cleanup code here if needed
+    # Shutdown: Add cleanup code here if needed. SIGTERM is left to uvicorn, which shuts
+    # down gracefully so this runs and the queued log records are written before exiting
     print("Shutting down application...")
-
-def sigterm_handler(signum, frame):
-    print(f"Received SIGTERM - {signum}. Performing cleanup...")
-    # Add any cleanup tasks here
-    sys.exit(0)
+    mcp_pool.shutdown()
+    HttpHelper.close()
+    LogHelper.stop_logging()
 
 app = FastAPI(
     title="Template For Agentic Tasks",
     description="API that exposes an endpoint to query an agentic assistant that leverages MCP servers and tools to execute tasks.",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
+# Compress responses for clients sending Accept-Encoding: gzip. Event streams are
+# left uncompressed by the middleware, so streamed events are not held back
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+@app.get("/health")
+async def health_endpoint():
+    return await anyio.to_thread.run_sync(get_health, limiter=health_limiter)
+
 @app.post("/assistant")
 async def query_endpoint(request: QueryRequest):
 
     print(f'Input query: {request.query}')
 
-    return run_query(request.query)
+    if request.stream:
+        return StreamingResponse(run_query_stream(request.query), media_type="text/event-stream")
+
+    # CrewAI kickoff is blocking, run it in a worker thread to keep the event loop free
+    return await run_in_threadpool(run_query, request.query)
+
+@app.post("/assistant/batch")
+async def batch_query_endpoint(request: QueryBatchRequest):
+
+    print(f'Input queries: {len(request.queries)}')
+
+    # Queries run concurrently, Ollama serves their LLM calls in parallel.
+    # A failing query is reported in its own item instead of failing the whole batch
+    responses = await asyncio.gather(
+        *(run_in_threadpool(run_query, query) for query in request.queries),
+        return_exceptions=True
+    )
+    results = []
+    for query, response in zip(request.queries, responses):
+        if isinstance(response, BaseException):
+            print(f"Warning: Query '{query}' failed: {response}")
+            response = {"error": str(response) or type(response).__name__}
+        results.append(response)
 
-if __name__ == "__main__":
-    port = int(os.getenv("PORT", 4000))
-    uvicorn.run("src.main:app", host="0.0.0.0", port=port, reload=True)
\ No newline at end of file
+    return {"results": results}
@@ -0,0 +1,145 @@
+import asyncio
+import os
+import threading
+import time
+
+from crewai_tools import MCPServerAdapter
+from configuration.mcp_config import MCPConfig
+from utils.config_helper import ConfigHelper
+
+# Seconds between health probes of the pooled MCP connections
+TOOLS_TTL = float(os.getenv("MCP_TOOLS_TTL", 300))
+
+# Seconds to wait for a single MCP server to answer a health probe
+PROBE_TIMEOUT = float(os.getenv("MCP_PROBE_TIMEOUT", 5))
+
+
+class MCPPool:
+    """
+    Process-lifetime pool of MCP server connections.
+
+    The MCP servers are spawned and connected once, on the first call to
+    `get_tools()` (or `startup()`), and the resulting tools are shared by every
+    request until `shutdown()` is called.
+    """
+
+    def __init__(self, server_params: dict):
+        # Server parameters keyed by their server ID in the configuration file
+        self.server_params = server_params
+        self._adapter = None
+        self._tools = None
+        self._checked_at = 0.0
+        # Error of the last failed connection attempt, reported by status()
+        self._connect_error = None
+        self._lock = threading.RLock()
+
+    def startup(self):
+        """
+        Connect to all configured MCP servers (no-op if already connected).
+        A failed connection is logged and retried on the next `get_tools()` call.
+        """
+        try:
+            self.get_tools()
+        except Exception as e:
+            print(f"Warning: Could not connect to MCP servers: {e}")
+
+    @property
+    def connected(self) -> bool:
+        return self._tools is not None
+
+    def get_tools(self):
+        """
+        Return the pooled MCP tools, connecting on first use.
+
+        Concurrent callers share a single connection attempt. Once `TOOLS_TTL`
+        has elapsed the servers are probed, and they are only respawned if the
+        probe fails.
+        """
+        tools = self._tools
+        if tools is not None and time.monotonic() - self._checked_at < TOOLS_TTL:
+            return tools
+
+        with self._lock:
+            if self._tools is not None and time.monotonic() - self._checked_at < TOOLS_TTL:
+                return self._tools
+
+            if self._tools is not None:
+                if self.probe():
+                    self._checked_at = time.monotonic()
+                    return self._tools
+                print("Warning: MCP health probe failed, reconnecting to MCP servers...")
+                self._disconnect()
+
+            self._connect()
+            return self._tools
+
+    @property
+    def tools_count(self) -> int:
+        return len(self._tools or [])
+
+    def probe(self) -> bool:
+        """Ping every pooled MCP session; True if all of them answered."""
+        try:
+            statuses = self.status()
+        except Exception as e:
+            print(f"Warning: MCP health probe error: {e}")
+            return False
+        for status in statuses:
+            if not status["ok"]:
+                print(f"Warning: MCP health probe error for '{status['server']}': {status['error']}")
+        return bool(statuses) and all(status["ok"] for status in statuses)
+
+    def status(self) -> list:
+        """
+        Ping every pooled MCP session without reconnecting.
+        Returns one {"server", "ok", "latency_ms" | "error"} entry per server.
+        """
+        adapter = self._adapter
+        if adapter is None:
+            error = self._connect_error or "not connected"
+            return [{"server": server, "ok": False, "error": error} for server in self.server_params]
+
+        # MCPServerAdapter runs its sessions on a private event loop thread
+        mcp_adapt = adapter._adapter
+        statuses = []
+        # Servers are reported by ID, their command line or URL may contain secrets
+        for server, session in zip(self.server_params, mcp_adapt.sessions):
+            start = time.perf_counter()
+            try:
+                asyncio.run_coroutine_threadsafe(
+                    session.send_ping(), mcp_adapt.loop
+                ).result(timeout=PROBE_TIMEOUT)
+                statuses.append({"server": server, "ok": True, "latency_ms": round((time.perf_counter() - start) * 1000, 1)})
+            except Exception as e:
+                statuses.append({"server": server, "ok": False, "error": str(e) or type(e).__name__})
+        return statuses
+
+    def shutdown(self):
+        """Disconnect from all MCP servers and terminate their processes."""
+        with self._lock:
+            self._disconnect()
+
+    def _connect(self):
+        try:
+            # Fresh copies on every connect, the MCP adapter pops keys (e.g. "transport") from dict params
+            adapter = MCPServerAdapter([dict(params) if isinstance(params, dict) else params for params in self.server_params.values()])
+            self._tools = adapter.__enter__()
+        except Exception as e:
+            self._connect_error = str(e) or type(e).__name__
+            raise
+        self._adapter = adapter
+        self._connect_error = None
+        self._checked_at = time.monotonic()
+        print(f"Available tools from MCP servers: {[tool.name for tool in self._tools]}")
+
+    def _disconnect(self):
+        adapter, self._adapter, self._tools = self._adapter, None, None
+        if adapter is not None:
+            try:
+                adapter.__exit__(None, None, None)
+            except Exception as e:
+                print(f"Warning: Error while closing MCP servers: {e}")
+
+
+# Load server parameters from the appropriate config file
+mcp_pool = MCPPool(MCPConfig(ConfigHelper.get_config_path()).get_all_server_params_by_id())
@@ -0,0 +1,33 @@
+import os
+import sys
+import uvicorn
+
+# Add the current directory to Python path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.config_helper import ConfigHelper
+from utils.log_helper import LogHelper
+
+# Entry point of the API server. It is kept apart from main.py and only imports light
+# modules: uvicorn worker processes are spawned and first re-import this file, and they
+# are restarted if they don't answer the supervisor within 5 seconds. The application
+# (CrewAI, MCP servers...) is only imported once the worker has started
+if __name__ == "__main__":
+    port = int(os.getenv("PORT", 4000))
+    # Also needed in this process: with several workers it only supervises them and
+    # never runs the lifespan, but still logs the server startup and worker restarts
+    LogHelper.configure_logging()
+    # Each worker process runs the lifespan, so it gets its own MCP pool and crews
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        workers=ConfigHelper.get_workers(),
+        # uvloop is not available on Windows
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
+        reload=False,
+        # Let uvicorn logs go through the application logging (see LogHelper)
+        log_config=None
+    )
+    LogHelper.stop_logging()
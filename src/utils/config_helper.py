@@ -1,23 +1,26 @@
 import os
 import pathlib
+import functools
+
+# Whether we're running in Docker, read once per process
+IN_DOCKER = os.environ.get('DOCKER_ENV', '').lower() == 'true'
 
 class ConfigHelper:
     """Utility class for configuration-related operations."""
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_config_path():
         """
         Choose config file based on environment.
         Returns the path to the appropriate configuration file.
+        The result is computed once per process.
         """
-        # Check if we're running in Docker
-        in_docker = os.environ.get('DOCKER_ENV', '').lower() == 'true'
-        
         # Base path for the project
         base_path = pathlib.Path(__file__).parent.parent.parent
         
         # For local development use mcp-config.local.json if it exists
-        if not in_docker and (base_path / "mcp-config.local.json").exists():
+        if not IN_DOCKER and (base_path / "mcp-config.local.json").exists():
             config_file = "mcp-config.local.json"
             print(f"Using local configuration: {config_file}")
         else:
@@ -27,13 +30,15 @@ class ConfigHelper:
         return str(base_path / config_file)
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_ollama_base_url():
         """
         Determine the appropriate Ollama base URL based on environment.
         Returns http://ollama:11434 in Docker, http://localhost:11434 otherwise.
+        The result is computed once per process.
         """
         # Check if we're running in Docker
-        if os.environ.get('DOCKER_ENV', '').lower() == 'true':
+        if IN_DOCKER:
             # Use the service name as defined in docker-compose.yml
             return "http://ollama:11434"
         else:
@@ -44,3 +49,28 @@ class ConfigHelper:
     def get_ollama_model() -> str:
         """Get the Ollama model name from environment variable or use default."""
         return os.getenv("OLLAMA_MODEL", "mistral")
+
+    @staticmethod
+    def get_thread_pool_size() -> int:
+        """Get the number of worker threads used to run blocking queries."""
+        return int(os.getenv("THREAD_POOL_SIZE", 32))
+
+    @staticmethod
+    def get_workers() -> int:
+        """Get the number of uvicorn worker processes, defaults to the CPU count."""
+        return int(os.getenv("WORKERS", os.cpu_count() or 1))
+
+    @staticmethod
+    def use_lazy_tool_schemas() -> bool:
+        """Whether tool argument schemas are left out of the prompt and fetched on demand (default false)."""
+        return os.getenv("LAZY_TOOL_SCHEMAS", "false").lower() == "true"
+
+    @staticmethod
+    def get_log_level() -> str:
+        """Get the log level from environment variable or use default (INFO)."""
+        return os.getenv("LOG_LEVEL", "INFO").upper()
+
+    @staticmethod
+    def get_max_batch_queries() -> int:
+        """Get the maximum number of queries accepted by a single /assistant/batch request."""
+        return int(os.getenv("MAX_BATCH_QUERIES", 16))
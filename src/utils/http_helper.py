@@ -0,0 +1,39 @@
+import httpx
+from litellm.llms.custom_httpx.http_handler import HTTPHandler
+
+from utils.config_helper import ConfigHelper
+
+class HttpHelper:
+    """Utility class for shared HTTP connection pools."""
+
+    _ollama_client = None
+    _ollama_handler = None
+
+    @classmethod
+    def get_ollama_client(cls) -> httpx.Client:
+        """
+        Get the pooled HTTP client for the Ollama server.
+        Connections are kept alive and reused across LLM calls instead of
+        opening a new one per call.
+        """
+        if cls._ollama_client is None:
+            cls._ollama_client = httpx.Client(
+                base_url=ConfigHelper.get_ollama_base_url(),
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60),
+                timeout=httpx.Timeout(600.0, connect=10.0)
+            )
+        return cls._ollama_client
+
+    @classmethod
+    def get_ollama_handler(cls) -> HTTPHandler:
+        """Get a LiteLLM HTTP handler backed by the pooled Ollama client."""
+        if cls._ollama_handler is None:
+            cls._ollama_handler = HTTPHandler(client=cls.get_ollama_client())
+        return cls._ollama_handler
+
+    @classmethod
+    def close(cls):
+        """Close the pooled HTTP connections."""
+        client, cls._ollama_client, cls._ollama_handler = cls._ollama_client, None, None
+        if client is not None:
+            client.close()
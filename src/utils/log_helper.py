@@ -1,15 +1,84 @@
+import logging
+import logging.handlers
+import queue
+import sys
+
+from utils.config_helper import ConfigHelper
+
+logger = logging.getLogger(__name__)
+
+# Loggers LOG_LEVEL applies to: the application ones and the uvicorn server and access logs.
+# Other libraries (httpx, LiteLLM, ...) stay at WARNING, as they log on every LLM call
+_APP_LOGGERS = ("utils", "uvicorn.error", "uvicorn.access")
+
 class LogHelper:
 
+    _listener = None
+    _queue_handler = None
+
+    @classmethod
+    def configure_logging(cls):
+        """
+        Route log records through a queue drained by a dedicated thread, so the
+        threads running the agents only enqueue records and never block on stdout.
+        """
+        if cls._listener is not None:
+            return
+
+        log_queue = queue.SimpleQueue()
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+        cls._queue_handler = logging.handlers.QueueHandler(log_queue)
+        root_logger = logging.getLogger()
+        # Drop the handlers libraries add at import (e.g. logging.basicConfig in gptcache),
+        # so records are not written twice
+        for handler in root_logger.handlers[:]:
+            root_logger.removeHandler(handler)
+        root_logger.addHandler(cls._queue_handler)
+        root_logger.setLevel(logging.WARNING)
+        for name in _APP_LOGGERS:
+            logging.getLogger(name).setLevel(ConfigHelper.get_log_level())
+
+        cls._listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        cls._listener.start()
+
+    @classmethod
+    def stop_logging(cls):
+        """Flush the queued log records and stop the logging thread."""
+        if cls._listener is not None:
+            logging.getLogger().removeHandler(cls._queue_handler)
+            cls._listener.stop()
+            cls._listener = None
+            cls._queue_handler = None
+
+    @staticmethod
+    def _summarize(output) -> dict:
+        """
+        Small projection of a step (AgentAction/AgentFinish) or task (TaskOutput) output,
+        leaving out heavy fields such as tool payloads and nested models.
+        """
+        content = str(
+            getattr(output, "raw", None) or getattr(output, "output", None) or getattr(output, "text", None) or ""
+        )
+        summary = {
+            "type": type(output).__name__,
+            "agent": getattr(output, "agent", None),
+            "task": getattr(output, "name", None),
+            "tool": getattr(output, "tool", None),
+            "length": len(content),
+            "preview": content[:200] + "..." if len(content) > 200 else content
+        }
+        return {key: value for key, value in summary.items() if value is not None}
+
     @staticmethod
     def log_step_callback(output):
-        print(f"""
-            Step completed!
-            details: {output.__dict__}
-        """)
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug("Step completed! details: %s", LogHelper._summarize(output))
 
     @staticmethod
     def log_task_callback(output):
-        print(f"""
-            Task completed!
-            details: {output.__dict__}
-        """)
\ No newline at end of file
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug("Task completed! details: %s", LogHelper._summarize(output))
@@ -1,11 +1,83 @@
+import re
+import functools
+
 from crewai.tasks.task_output import TaskOutput
 
+@functools.lru_cache(maxsize=128)
+def _keywords_regex(keywords: tuple) -> re.Pattern:
+    """Compile a case-insensitive regex matching any of the keywords"""
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+def _indicators_regex(no_data_indicators: frozenset, error_indicators: tuple) -> tuple:
+    """
+    Compile a regex finding "no data" and error indicators in a single scan
+
+    Returns:
+        tuple: The regex and, for each of its named groups, whether the indicator it matches
+            counts as a "no data" indicator and as an error indicator
+    """
+    # Longest first, so the flags of a longer indicator also cover the shorter ones it
+    # starts with ("failed to fetch" and "failed"). The lookahead matches at every
+    # position, so indicators overlapping each other are all found
+    indicators = sorted(no_data_indicators | set(error_indicators), key=lambda k: (-len(k), k))
+    flags = {
+        f"i{index}": (indicator in no_data_indicators, any(e in indicator for e in error_indicators))
+        for index, indicator in enumerate(indicators)
+    }
+    alternation = "|".join(f"(?P<i{index}>{re.escape(indicator)})" for index, indicator in enumerate(indicators))
+    return re.compile(f"(?=(?:{alternation}))", re.IGNORECASE), flags
+
 class TaskValidator:
     """
     A comprehensive utility class for validating task outputs and conditions.
     This class provides various methods to check if tasks have meaningful results.
     """
 
+    # Common "no data" responses
+    _NO_DATA_INDICATORS = frozenset({
+        "thought:",
+        "using a different method to find",
+        "i do not know",
+        "i don't know",
+        "no data",
+        "failed to fetch",
+        "error",
+        "unable to",
+        "could not",
+        "cannot",
+        "timeout",
+        "not available"
+    })
+    # Matched in a single pass. Sorted only so the pattern doesn't depend on the set
+    # iteration order, which changes between processes
+    _NO_DATA_RE = _keywords_regex(tuple(sorted(_NO_DATA_INDICATORS)))
+
+    # Indicators of a failed tool call or execution error in the output
+    _ERROR_INDICATORS = ("error", "exception", "traceback", "failed", "timed out")
+    _ERROR_RE = _keywords_regex(_ERROR_INDICATORS)
+
+    # Both kinds of indicators at once, for get_task_info
+    _INDICATORS_RE, _INDICATOR_FLAGS = _indicators_regex(_NO_DATA_INDICATORS, _ERROR_INDICATORS)
+
+    # Meaningful responses are usually longer than this
+    _MIN_CONTENT_LENGTH = 50
+
+    @classmethod
+    def _has_meaningful_content(cls, content: str) -> bool:
+        # Length first, as it is cheaper than scanning the content
+        if len(content) < cls._MIN_CONTENT_LENGTH:
+            return False
+        
+        # If output contains any "no data" indicators, consider it as missing data
+        return cls._NO_DATA_RE.search(content) is None
+
+    @staticmethod
+    def _get_tool_calls(output: TaskOutput) -> list:
+        agent_execution = getattr(output, 'agent_execution', None)
+        if not agent_execution:
+            return []
+        return getattr(agent_execution, 'tool_calls', None) or []
+
     @staticmethod
     def is_data_not_missing(output: TaskOutput) -> bool:
         """
@@ -21,32 +93,8 @@ class TaskValidator:
         if not output or not output.raw:
             return False
         
-        # Method 2: Check if the raw output contains meaningful content
-        raw_content = str(output.raw).strip().lower()
-        
-        # Filter out common "no data" responses
-        no_data_indicators = [
-            "thought:",
-            "using a different method to find"
-            "i do not know",
-            "i don't know", 
-            "no data",
-            "failed to fetch",
-            "error",
-            "unable to",
-            "could not",
-            "cannot",
-            "timeout",
-            "not available"
-        ]
-        
-        # If output contains any "no data" indicators, consider it as missing data
-        for indicator in no_data_indicators:
-            if indicator in raw_content:
-                return False
-        
-        # Method 3: Check minimum content length (meaningful responses are usually longer)
-        if len(raw_content) < 50:  # Adjust threshold as needed
+        # Method 2 and 3: Check minimum content length and "no data" indicators
+        if not TaskValidator._has_meaningful_content(str(output.raw).strip()):
             return False
         
         # Method 4: Check if agent_execution has tool calls/observations
@@ -68,14 +116,46 @@ class TaskValidator:
         Returns:
             bool: True if there are successful tool calls, False otherwise
         """
-        if not output or not hasattr(output, 'agent_execution') or not output.agent_execution:
+        if not output:
             return False
             
-        if hasattr(output.agent_execution, 'tool_calls') and output.agent_execution.tool_calls:
-            # Check if any tool calls were successful (you can customize this logic)
-            return len(output.agent_execution.tool_calls) > 0
+        # Check if any tool calls were successful (you can customize this logic)
+        return len(TaskValidator._get_tool_calls(output)) > 0
+
+    @classmethod
+    def has_minimum_content_length(cls, output: TaskOutput, min_length: int = None) -> bool:
+        """
+        Check if the task output content is at least `min_length` characters long
+        
+        Args:
+            output (TaskOutput): The output from a task
+            min_length (int): Minimum content length, defaults to 50
+            
+        Returns:
+            bool: True if the content is long enough, False otherwise
+        """
+        if not output or not output.raw:
+            return False
+            
+        if min_length is None:
+            min_length = cls._MIN_CONTENT_LENGTH
+        return len(str(output.raw).strip()) >= min_length
+
+    @classmethod
+    def does_not_contain_error_indicators(cls, output: TaskOutput) -> bool:
+        """
+        Check if the task output is free of error indicators
+        
+        Args:
+            output (TaskOutput): The output from a task
+            
+        Returns:
+            bool: True if no error indicators are found, False otherwise
+        """
+        if not output or not output.raw:
+            return True
             
-        return False
+        return cls._ERROR_RE.search(str(output.raw)) is None
 
     @staticmethod
     def contains_keywords(output: TaskOutput, keywords: list) -> bool:
@@ -89,11 +169,10 @@ class TaskValidator:
         Returns:
             bool: True if any keywords are found, False otherwise
         """
-        if not output or not output.raw:
+        if not output or not output.raw or not keywords:
             return False
             
-        content = str(output.raw).lower()
-        return any(keyword.lower() in content for keyword in keywords)
+        return _keywords_regex(tuple(keywords)).search(str(output.raw)) is not None
 
     @classmethod
     def get_task_info(cls, output: TaskOutput) -> dict:
@@ -109,28 +188,39 @@ class TaskValidator:
         if not output:
             return {"error": "No output provided"}
             
+        # Normalize the content once and derive every check from it
+        raw = str(output.raw) if output.raw else ""
+        content = raw.strip()
+        meets_min_length = len(content) >= cls._MIN_CONTENT_LENGTH
+        tool_calls = cls._get_tool_calls(output)
+
+        # Look for "no data" and error indicators in the same scan
+        has_no_data = has_errors = False
+        for match in cls._INDICATORS_RE.finditer(content):
+            is_no_data, is_error = cls._INDICATOR_FLAGS[match.lastgroup]
+            has_no_data |= is_no_data
+            has_errors |= is_error
+            if has_no_data and has_errors:
+                break
+            
         info = {
             "has_raw_output": bool(output.raw),
-            "output_length": len(str(output.raw)) if output.raw else 0,
+            "output_length": len(raw),
             "has_agent_execution": hasattr(output, 'agent_execution') and output.agent_execution is not None,
-            "output_preview": str(output.raw)[:200] + "..." if output.raw and len(str(output.raw)) > 200 else str(output.raw),
-            "has_meaningful_data": cls.is_data_not_missing(output),
-            "has_tool_calls": cls.has_successful_tool_calls(output),
-            "meets_min_length": cls.has_minimum_content_length(output),
-            "no_errors": cls.does_not_contain_error_indicators(output)
+            "output_preview": raw[:200] + "..." if len(raw) > 200 else (raw or str(output.raw)),
+            "has_meaningful_data": bool(raw) and meets_min_length and not has_no_data,
+            "has_tool_calls": len(tool_calls) > 0,
+            "meets_min_length": meets_min_length,
+            "no_errors": not has_errors
         }
         
         # Add tool call information if available
         if hasattr(output, 'agent_execution') and output.agent_execution:
-            if hasattr(output.agent_execution, 'tool_calls') and output.agent_execution.tool_calls:
-                info["tool_calls_count"] = len(output.agent_execution.tool_calls)
-                info["tools_used"] = [
-                    getattr(call, 'tool_name', 'unknown') 
-                    for call in output.agent_execution.tool_calls
-                ]
-            else:
-                info["tool_calls_count"] = 0
-                info["tools_used"] = []
+            info["tool_calls_count"] = len(tool_calls)
+            info["tools_used"] = [
+                getattr(call, 'tool_name', 'unknown') 
+                for call in tool_calls
+            ]
         
         return info
 